@@ -1,7 +1,7 @@
 """Binary sensor platform for Adaptive Lighting Pro."""
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.core import HomeAssistant
@@ -11,28 +11,34 @@ from .const import DOMAIN, RATE_LIMIT_ENTITY_ID
 from .entity import AdaptiveLightingProEntity
 
 
+MANUAL_ACTION_SENSORS: Tuple[Tuple[str, str, str], ...] = (
+    ("brighter", "ALP Brighter Active", "alp_brighter_active"),
+    ("dimmer", "ALP Dimmer Active", "alp_dimmer_active"),
+    ("warmer", "ALP Warmer Active", "alp_warmer_active"),
+    ("cooler", "ALP Cooler Active", "alp_cooler_active"),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     runtime = hass.data[DOMAIN][entry.entry_id]
-    entities = [AdaptiveLightingProRateLimitBinarySensor(runtime)]
-    for action, name in MANUAL_ACTION_SENSORS.items():
-        entities.append(AdaptiveLightingProManualActionBinarySensor(runtime, action, name))
-    for zone_id in runtime.zone_states().keys():
-        entities.append(AdaptiveLightingProManualBinarySensor(runtime, zone_id))
+    entities = [
+        AdaptiveLightingProRateLimitBinarySensor(runtime),
+        *(
+            AdaptiveLightingProManualActionBinarySensor(runtime, *spec)
+            for spec in MANUAL_ACTION_SENSORS
+        ),
+        *(
+            AdaptiveLightingProManualBinarySensor(runtime, zone_id)
+            for zone_id in runtime.zone_states()
+        ),
+    ]
     async_add_entities(entities)
 
 
-MANUAL_ACTION_SENSORS = {
-    "brighter": "ALP Brighter Active",
-    "dimmer": "ALP Dimmer Active",
-    "warmer": "ALP Warmer Active",
-    "cooler": "ALP Cooler Active",
-}
-
-
 class AdaptiveLightingProRateLimitBinarySensor(
     AdaptiveLightingProEntity, BinarySensorEntity
 ):
@@ -49,11 +55,7 @@ class AdaptiveLightingProRateLimitBinarySensor(
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        return {
-            "rate_window_load": self._runtime.analytics_summary().get(
-                "rate_window_load", 0
-            )
-        }
+        return {"rate_window_load": self._runtime.rate_window_load()}
 
 
 class AdaptiveLightingProManualBinarySensor(
@@ -67,12 +69,11 @@ class AdaptiveLightingProManualBinarySensor(
 
     @property
     def is_on(self) -> bool:
-        return bool(self._runtime.zone_states()[self._zone_id]["manual_active"])
+        return self._runtime.zone_manual_active(self._zone_id)
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        state = self._runtime.zone_states()[self._zone_id]
-        return {"duration": state.get("manual_duration")}
+        return {"duration": self._runtime.zone_manual_duration(self._zone_id)}
 
 
 class AdaptiveLightingProManualActionBinarySensor(
@@ -80,10 +81,10 @@ class AdaptiveLightingProManualActionBinarySensor(
 ):
     """Binary sensor mirroring manual adjustment scripts."""
 
-    def __init__(self, runtime, action: str, name: str) -> None:
-        super().__init__(runtime, name, f"alp_{action}_active")
+    def __init__(self, runtime, action: str, name: str, unique_id: str) -> None:
+        super().__init__(runtime, name, unique_id)
         self._action = action
 
     @property
     def is_on(self) -> bool:
-        return bool(self._runtime.manual_action_flags().get(self._action))
+        return self._runtime.manual_action_active(self._action)
@@ -29,6 +29,12 @@ async def async_setup_entry(
 
 
 class AdaptiveLightingProButtonBase(AdaptiveLightingProEntity, ButtonEntity):
+    _NAME: str
+    _UNIQUE_ID: str
+
+    def __init__(self, runtime) -> None:
+        super().__init__(runtime, self._NAME, self._UNIQUE_ID)
+
     async def async_press(self) -> None:
         await self._async_handle()
 
@@ -37,41 +43,40 @@ class AdaptiveLightingProButtonBase(AdaptiveLightingProEntity, ButtonEntity):
 
 
 class AdaptiveLightingProForceSyncButton(AdaptiveLightingProButtonBase):
-    def __init__(self, runtime) -> None:
-        super().__init__(runtime, "ALP Force Sync", "alp_force_sync_button")
+    _NAME = "ALP Force Sync"
+    _UNIQUE_ID = "alp_force_sync_button"
 
     async def _async_handle(self) -> None:
         await self._runtime.force_sync()
 
 
 class AdaptiveLightingProResetButton(AdaptiveLightingProButtonBase):
-    def __init__(self, runtime) -> None:
-        super().__init__(runtime, "ALP Reset", "alp_reset_button")
+    _NAME = "ALP Reset"
+    _UNIQUE_ID = "alp_reset_button"
 
     async def _async_handle(self) -> None:
-        for zone_id in self._runtime.zone_states().keys():
-            await self._runtime.reset_zone(zone_id)
+        await self._runtime.reset_all_zones()
 
 
 class AdaptiveLightingProSceneResetButton(AdaptiveLightingProButtonBase):
-    def __init__(self, runtime) -> None:
-        super().__init__(runtime, "ALP Scene Reset", "alp_scene_reset_button")
+    _NAME = "ALP Scene Reset"
+    _UNIQUE_ID = "alp_scene_reset_button"
 
     async def _async_handle(self) -> None:
         await self._runtime.select_scene("default")
 
 
 class AdaptiveLightingProBackupButton(AdaptiveLightingProButtonBase):
-    def __init__(self, runtime) -> None:
-        super().__init__(runtime, "ALP Backup Preferences", "alp_backup_button")
+    _NAME = "ALP Backup Preferences"
+    _UNIQUE_ID = "alp_backup_button"
 
     async def _async_handle(self) -> None:
         await self._runtime.backup_prefs()
 
 
 class AdaptiveLightingProRestoreButton(AdaptiveLightingProButtonBase):
-    def __init__(self, runtime) -> None:
-        super().__init__(runtime, "ALP Restore Preferences", "alp_restore_button")
+    _NAME = "ALP Restore Preferences"
+    _UNIQUE_ID = "alp_restore_button"
 
     async def _async_handle(self) -> None:
         await self._runtime.restore_prefs()
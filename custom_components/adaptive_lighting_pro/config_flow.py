@@ -2,39 +2,29 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Set
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
 
 try:  # pragma: no cover - compatibility shim for tests without HA selector helper
     from homeassistant.helpers import selector
 except ImportError:  # pragma: no cover - fallback for lightweight test harness
-    class _SelectorModule:
-        class EntitySelectorConfig(dict):
-            def __init__(self, **kwargs) -> None:
-                super().__init__(**kwargs)
-
-        class EntitySelector:
-            def __init__(self, config: dict | None = None) -> None:
-                self.config = config or {}
-
-            def __call__(self, value: Any) -> Any:
-                return value
+    class _IdentitySelector:
+        def __init__(self, config: dict | None = None) -> None:
+            self.config = config or {}
 
-        class DeviceSelectorConfig(dict):
-            def __init__(self, **kwargs) -> None:
-                super().__init__(**kwargs)
+        def __call__(self, value: Any) -> Any:
+            return value
 
-        class DeviceSelector:
-            def __init__(self, config: dict | None = None) -> None:
-                self.config = config or {}
-
-            def __call__(self, value: Any) -> Any:
-                return value
+    class _SelectorModule:
+        EntitySelectorConfig = DeviceSelectorConfig = dict
+        EntitySelector = DeviceSelector = _IdentitySelector
 
-    selector = _SelectorModule()
+    selector = _SelectorModule
 
 from .const import (
     CONF_CONTROLLERS,
@@ -54,47 +44,89 @@ from .const import (
     DEFAULT_DEBUG_CONFIG,
     DEFAULT_ENV_MULTIPLIER_BOOST,
     DEFAULT_NIGHTLY_SWEEP_TIME,
-    DEFAULT_RATE_LIMIT_MAX_EVENTS,
-    DEFAULT_RATE_LIMIT_WINDOW,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_TIMEOUTS,
     DEFAULT_WATCHDOG_INTERVAL_MIN,
     DOMAIN,
 )
 from .utils.validators import ValidationError, validate_zone_config
 
-ZONES_SCHEMA = vol.Schema(
-    {
-        vol.Required("zone_id"): str,
-        vol.Required("al_switch"): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="switch")
-        ),
-        vol.Required("lights"): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="light", multiple=True)
-        ),
-        vol.Optional("enabled", default=True): bool,
-        vol.Optional("zone_multiplier", default=1.0): float,
-        vol.Optional("sunrise_offset_min", default=0): int,
-        vol.Optional("environmental_boost_enabled", default=True): bool,
-        vol.Optional("sunset_boost_enabled", default=True): bool,
-    }
-)
+_SENSOR_KEYS: Final = (CONF_LUX_SENSOR, CONF_WEATHER_ENTITY, CONF_SONOS_SENSOR)
+_CONTROLLER_KEYS: Final = (CONF_ZEN32_DEVICE,)
 
-DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ZONES): [ZONES_SCHEMA],
-        vol.Optional(CONF_LUX_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        ),
-        vol.Optional(CONF_WEATHER_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="weather")
-        ),
-        vol.Optional(CONF_SONOS_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        ),
-        vol.Optional(CONF_ZEN32_DEVICE): selector.DeviceSelector(
-            selector.DeviceSelectorConfig(integration="zwave_js")
-        ),
-    }
-)
+
+@lru_cache(maxsize=None)
+def _entity_selector(domain: str, multiple: bool = False) -> selector.EntitySelector:
+    """Return a shared entity selector for ``domain``."""
+
+    return selector.EntitySelector(
+        selector.EntitySelectorConfig(domain=domain, multiple=multiple)
+    )
+
+
+@lru_cache(maxsize=None)
+def _device_selector(integration: str) -> selector.DeviceSelector:
+    """Return a shared device selector for ``integration``."""
+
+    return selector.DeviceSelector(
+        selector.DeviceSelectorConfig(integration=integration)
+    )
+
+
+@lru_cache(maxsize=None)
+def _data_schema() -> vol.Schema:
+    """Return the user-step schema, built on first use of the config flow."""
+
+    zones_schema = vol.Schema(
+        {
+            vol.Required("zone_id"): str,
+            vol.Required("al_switch"): _entity_selector("switch"),
+            vol.Required("lights"): _entity_selector("light", multiple=True),
+            vol.Optional("enabled", default=True): bool,
+            vol.Optional("zone_multiplier", default=1.0): float,
+            vol.Optional("sunrise_offset_min", default=0): int,
+            vol.Optional("environmental_boost_enabled", default=True): bool,
+            vol.Optional("sunset_boost_enabled", default=True): bool,
+        }
+    )
+    return vol.Schema(
+        {
+            vol.Required(CONF_ZONES): [zones_schema],
+            vol.Optional(CONF_LUX_SENSOR): _entity_selector("sensor"),
+            vol.Optional(CONF_WEATHER_ENTITY): _entity_selector("weather"),
+            vol.Optional(CONF_SONOS_SENSOR): _entity_selector("sensor"),
+            vol.Optional(CONF_ZEN32_DEVICE): _device_selector("zwave_js"),
+        }
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_options_schema(
+    base_day_min: int,
+    base_night_min: int,
+    rate_max: int,
+    rate_window: int,
+    nightly_time: str,
+    watchdog_interval: int,
+    debug_log: bool,
+    trace_logbook: bool,
+    env_boost: float,
+) -> vol.Schema:
+    """Return the options schema for a set of defaults, reusing prior builds."""
+
+    return vol.Schema(
+        {
+            vol.Required("base_day_min", default=base_day_min): int,
+            vol.Required("base_night_min", default=base_night_min): int,
+            vol.Required("rate_max", default=rate_max): int,
+            vol.Required("rate_window", default=rate_window): int,
+            vol.Required("nightly_time", default=nightly_time): str,
+            vol.Required("watchdog_interval", default=watchdog_interval): int,
+            vol.Required("debug_log", default=debug_log): bool,
+            vol.Required("trace_logbook", default=trace_logbook): bool,
+            vol.Required("env_boost", default=env_boost): float,
+        }
+    )
 
 
 class AdaptiveLightingProConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -102,18 +134,18 @@ class AdaptiveLightingProConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input: Dict[str, Any] | None = None):
         if user_input is None:
-            return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA)
+            return self.async_show_form(step_id="user", data_schema=_data_schema())
 
         try:
             validated_zones = self._validate_zones(user_input[CONF_ZONES])
         except ValidationError as err:
             return self.async_show_form(
                 step_id="user",
-                data_schema=DATA_SCHEMA,
+                data_schema=_data_schema(),
                 errors={err.field: err.message},
             )
         data = {
-            CONF_INSTALLATION_ID: str(uuid.uuid4()),
+            CONF_INSTALLATION_ID: uuid.uuid4().hex,
             CONF_ZONES: validated_zones,
             CONF_SENSORS: self._build_sensors(user_input),
             CONF_CONTROLLERS: self._build_controllers(user_input),
@@ -122,35 +154,29 @@ class AdaptiveLightingProConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _validate_zones(self, zones: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         validated: List[Dict[str, Any]] = []
-        existing: List[str] = []
+        existing: Set[str] = set()
         for zone in zones:
             validated_zone = validate_zone_config(self.hass, zone, existing)
-            existing.append(validated_zone["zone_id"])
+            existing.add(validated_zone["zone_id"])
             validated.append(validated_zone)
         return validated
 
     @staticmethod
     def _build_sensors(user_input: Dict[str, Any]) -> Dict[str, Any]:
-        sensors: Dict[str, Any] = {}
-        for key in (CONF_LUX_SENSOR, CONF_WEATHER_ENTITY, CONF_SONOS_SENSOR):
-            value = user_input.get(key)
-            if value:
-                sensors[key] = value
-        return sensors
+        return {key: user_input[key] for key in _SENSOR_KEYS if user_input.get(key)}
 
     @staticmethod
     def _build_controllers(user_input: Dict[str, Any]) -> Dict[str, Any]:
-        controllers: Dict[str, Any] = {}
-        device_id = user_input.get(CONF_ZEN32_DEVICE)
-        if device_id:
-            controllers[CONF_ZEN32_DEVICE] = device_id
-        return controllers
+        return {
+            key: user_input[key] for key in _CONTROLLER_KEYS if user_input.get(key)
+        }
 
     async def async_step_import(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
         return await self.async_step_user(user_input)
 
     @staticmethod
-    async def async_get_options_flow(entry: config_entries.ConfigEntry):
+    @callback
+    def async_get_options_flow(entry: config_entries.ConfigEntry):
         return AdaptiveLightingProOptionsFlowHandler(entry)
 
 
@@ -159,18 +185,37 @@ class AdaptiveLightingProOptionsFlowHandler(config_entries.OptionsFlow):
         self._entry = entry
 
     async def async_step_init(self, user_input: Dict[str, Any] | None = None):
-        options = dict(self._entry.options)
-        defaults = {
-            CONF_TIMEOUTS: options.get(
-                CONF_TIMEOUTS, {"base_day_min": 60, "base_night_min": 180}
-            ),
-            CONF_RATE_LIMIT: options.get(
-                CONF_RATE_LIMIT,
-                {
-                    "max_events": DEFAULT_RATE_LIMIT_MAX_EVENTS,
-                    "window_sec": DEFAULT_RATE_LIMIT_WINDOW,
-                },
-            ),
+        if user_input is None:
+            return self.async_show_form(
+                step_id="init", data_schema=self._options_schema(self._defaults())
+            )
+        options = {
+            **self._entry.options,
+            CONF_TIMEOUTS: {
+                "base_day_min": user_input["base_day_min"],
+                "base_night_min": user_input["base_night_min"],
+            },
+            CONF_RATE_LIMIT: {
+                "max_events": user_input["rate_max"],
+                "window_sec": user_input["rate_window"],
+            },
+            CONF_NIGHTLY_SWEEP: {"time": user_input["nightly_time"]},
+            CONF_WATCHDOG: {"interval_min": user_input["watchdog_interval"]},
+            CONF_DEBUG: {
+                "debug_log": user_input["debug_log"],
+                "trace_logbook": user_input["trace_logbook"],
+            },
+            CONF_ENV_BOOST: float(user_input["env_boost"]),
+        }
+        return self.async_create_entry(title="Options", data=options)
+
+    def _defaults(self) -> Dict[str, Any]:
+        """Return current options merged with defaults."""
+
+        options = self._entry.options
+        return {
+            CONF_TIMEOUTS: options.get(CONF_TIMEOUTS, DEFAULT_TIMEOUTS),
+            CONF_RATE_LIMIT: options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
             CONF_NIGHTLY_SWEEP: options.get(
                 CONF_NIGHTLY_SWEEP, {"time": DEFAULT_NIGHTLY_SWEEP_TIME}
             ),
@@ -180,34 +225,17 @@ class AdaptiveLightingProOptionsFlowHandler(config_entries.OptionsFlow):
             CONF_DEBUG: options.get(CONF_DEBUG, DEFAULT_DEBUG_CONFIG),
             CONF_ENV_BOOST: options.get(CONF_ENV_BOOST, DEFAULT_ENV_MULTIPLIER_BOOST),
         }
-        schema = vol.Schema(
-            {
-                vol.Required("base_day_min", default=defaults[CONF_TIMEOUTS]["base_day_min"]): int,
-                vol.Required("base_night_min", default=defaults[CONF_TIMEOUTS]["base_night_min"]): int,
-                vol.Required("rate_max", default=defaults[CONF_RATE_LIMIT]["max_events"]): int,
-                vol.Required("rate_window", default=defaults[CONF_RATE_LIMIT]["window_sec"]): int,
-                vol.Required("nightly_time", default=defaults[CONF_NIGHTLY_SWEEP]["time"]): str,
-                vol.Required("watchdog_interval", default=defaults[CONF_WATCHDOG]["interval_min"]): int,
-                vol.Required("debug_log", default=defaults[CONF_DEBUG]["debug_log"]): bool,
-                vol.Required("trace_logbook", default=defaults[CONF_DEBUG]["trace_logbook"]): bool,
-                vol.Required("env_boost", default=defaults[CONF_ENV_BOOST]): float,
-            }
+
+    @staticmethod
+    def _options_schema(defaults: Dict[str, Any]) -> vol.Schema:
+        return _build_options_schema(
+            defaults[CONF_TIMEOUTS]["base_day_min"],
+            defaults[CONF_TIMEOUTS]["base_night_min"],
+            defaults[CONF_RATE_LIMIT]["max_events"],
+            defaults[CONF_RATE_LIMIT]["window_sec"],
+            defaults[CONF_NIGHTLY_SWEEP]["time"],
+            defaults[CONF_WATCHDOG]["interval_min"],
+            defaults[CONF_DEBUG]["debug_log"],
+            defaults[CONF_DEBUG]["trace_logbook"],
+            defaults[CONF_ENV_BOOST],
         )
-        if user_input is None:
-            return self.async_show_form(step_id="init", data_schema=schema)
-        options[CONF_TIMEOUTS] = {
-            "base_day_min": user_input["base_day_min"],
-            "base_night_min": user_input["base_night_min"],
-        }
-        options[CONF_RATE_LIMIT] = {
-            "max_events": user_input["rate_max"],
-            "window_sec": user_input["rate_window"],
-        }
-        options[CONF_NIGHTLY_SWEEP] = {"time": user_input["nightly_time"]}
-        options[CONF_WATCHDOG] = {"interval_min": user_input["watchdog_interval"]}
-        options[CONF_DEBUG] = {
-            "debug_log": user_input["debug_log"],
-            "trace_logbook": user_input["trace_logbook"],
-        }
-        options[CONF_ENV_BOOST] = float(user_input["env_boost"])
-        return self.async_create_entry(title="Options", data=options)
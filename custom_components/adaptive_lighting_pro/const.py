@@ -2,17 +2,18 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "adaptive_lighting_pro"
-PLATFORMS: Final = [
+PLATFORMS: Final = (
     "switch",
     "sensor",
     "binary_sensor",
     "number",
     "select",
     "button",
-]
+)
 
 CONF_ZONES: Final = "zones"
 CONF_SENSORS: Final = "sensors"
@@ -47,41 +48,59 @@ EVENT_BUTTON_PRESSED: Final = "alp_button_pressed"
 
 DEFAULT_BASE_DAY_MIN: Final = 60
 DEFAULT_BASE_NIGHT_MIN: Final = 180
-DEFAULT_MODE_MULTIPLIERS: Final = {
-    "adaptive": 1.0,
-    "work": 0.5,
-    "focus": 0.75,
-    "relax": 1.25,
-    "movie": 2.0,
-    "late_night": 3.0,
-}
+DEFAULT_TIMEOUTS: Final = MappingProxyType(
+    {"base_day_min": DEFAULT_BASE_DAY_MIN, "base_night_min": DEFAULT_BASE_NIGHT_MIN}
+)
+DEFAULT_MODE_MULTIPLIERS: Final = MappingProxyType(
+    {
+        "adaptive": 1.0,
+        "work": 0.5,
+        "focus": 0.75,
+        "relax": 1.25,
+        "movie": 2.0,
+        "late_night": 3.0,
+    }
+)
 DEFAULT_ENV_MULTIPLIER_BOOST: Final = 0.8
 DEFAULT_BRIGHTNESS_STEP: Final = 20
 DEFAULT_COLOR_TEMP_STEP: Final = 500
+BRIGHTNESS_PCT_MIN: Final = 1
+BRIGHTNESS_PCT_MAX: Final = 100
+COLOR_TEMP_KELVIN_MIN: Final = 1800
+COLOR_TEMP_KELVIN_MAX: Final = 6500
 DEFAULT_RATE_LIMIT_MAX_EVENTS: Final = 10
 DEFAULT_RATE_LIMIT_WINDOW: Final = 30
+DEFAULT_RATE_LIMIT: Final = MappingProxyType(
+    {
+        "max_events": DEFAULT_RATE_LIMIT_MAX_EVENTS,
+        "window_sec": DEFAULT_RATE_LIMIT_WINDOW,
+    }
+)
 DEFAULT_NIGHTLY_SWEEP_TIME: Final = "03:30"
 DEFAULT_WATCHDOG_INTERVAL_MIN: Final = 5
-DEFAULT_SCENE_ORDER: Final = [
+DEFAULT_SCENE_ORDER: Final = (
     "default",
     "all_lights",
     "no_spots",
     "evening_comfort",
     "ultra_dim",
-]
-MODE_ALIASES: Final = {
-    "Bright Focus": "focus",
-    "Dim Relax": "relax",
-    "Warm Evening": "movie",
-    "Cool Energy": "work",
-}
-DEFAULT_SCENE_PRESETS: Final = {
+)
+MODE_ALIASES: Final = MappingProxyType(
+    {
+        "Bright Focus": "focus",
+        "Dim Relax": "relax",
+        "Warm Evening": "movie",
+        "Cool Energy": "work",
+    }
+)
+_NO_OFFSETS = MappingProxyType({"brightness": 0, "warmth": 0})
+_DEFAULT_SCENE_PRESETS = {
     "default": {
         "adapt_brightness": True,
         "adapt_color_temp": True,
         "manual": False,
         "actions": [],
-        "offsets": {"brightness": 0, "warmth": 0},
+        "offsets": _NO_OFFSETS,
     },
     "all_lights": {
         "brightness_pct": 92,
@@ -107,7 +126,7 @@ DEFAULT_SCENE_PRESETS: Final = {
                 },
             },
         ],
-        "offsets": {"brightness": 0, "warmth": 0},
+        "offsets": _NO_OFFSETS,
     },
     "no_spots": {
         "brightness_pct": 70,
@@ -172,7 +191,12 @@ DEFAULT_SCENE_PRESETS: Final = {
         "offsets": {"brightness": -50, "warmth": -1000},
     },
 }
-DEFAULT_DEBUG_CONFIG: Final = {"debug_log": False, "trace_logbook": False}
+DEFAULT_SCENE_PRESETS: Final = MappingProxyType(
+    {scene: MappingProxyType(preset) for scene, preset in _DEFAULT_SCENE_PRESETS.items()}
+)
+DEFAULT_DEBUG_CONFIG: Final = MappingProxyType(
+    {"debug_log": False, "trace_logbook": False}
+)
 DEFAULT_FORCE_APPLY: Final = False
 
 MANUAL_DEBOUNCE_MS: Final = 500
@@ -213,4 +237,4 @@ WATCHDOG_EVENT: Final = "alp_watchdog_tick"
 SWEEP_EVENT: Final = "alp_nightly_sweep"
 
 RETRY_ATTEMPTS: Final = 3
-RETRY_BACKOFFS: Final = [1, 2, 4]
+RETRY_BACKOFFS: Final = (1, 2, 4)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from homeassistant.core import HomeAssistant
 
@@ -81,7 +81,7 @@ class ExecutorManager:
         )
 
     async def change_switch_settings(
-        self, entity_id: str, data: Dict[str, Any]
+        self, entity_id: str | List[str], data: Dict[str, Any]
     ) -> Dict[str, Any]:
         payload = {"entity_id": entity_id, **data}
         return await self._execute(
@@ -1,15 +1,13 @@
 """Health monitoring utilities."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, NamedTuple
 
 from ..utils.metrics import MetricsRegistry
 from ..utils.statistics import DailyCounters
 
 
-@dataclass
-class HealthSnapshot:
+class HealthSnapshot(NamedTuple):
     score: int
     summary: Dict[str, int]
 
@@ -37,6 +35,10 @@ class HealthMonitor:
     def set_rate_load(self, load: float) -> None:
         self._rate_window_load = load
 
+    @property
+    def rate_window_load(self) -> float:
+        return round(self._rate_window_load, 2)
+
     def snapshot(self) -> HealthSnapshot:
         failures = self._metrics.as_dict()["failures"]
         penalties = failures * 10 + int(self._counters.rate_limited * 5)
@@ -47,6 +49,6 @@ class HealthMonitor:
             "mode": self._mode,
             "scene": self._scene,
             "system_state": self._system_state,
-            "rate_window_load": round(self._rate_window_load, 2),
+            "rate_window_load": self.rate_window_load,
         }
-        return HealthSnapshot(score=score, summary=summary)
+        return HealthSnapshot(score, summary)
@@ -5,7 +5,7 @@ import asyncio
 import logging
 from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Sequence
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall
@@ -26,18 +26,26 @@ from ..const import (
     CONF_TIMEOUTS,
     CONF_WATCHDOG,
     CONF_ZONES,
+    DEFAULT_BASE_DAY_MIN,
+    DEFAULT_BASE_NIGHT_MIN,
     DEFAULT_DEBUG_CONFIG,
     DEFAULT_MODE_MULTIPLIERS,
     DEFAULT_NIGHTLY_SWEEP_TIME,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_RATE_LIMIT_MAX_EVENTS,
     DEFAULT_RATE_LIMIT_WINDOW,
     DEFAULT_SCENE_ORDER,
     DEFAULT_SCENE_PRESETS,
+    DEFAULT_TIMEOUTS,
     DEFAULT_WATCHDOG_INTERVAL_MIN,
     DEFAULT_FORCE_APPLY,
     DEFAULT_ENV_MULTIPLIER_BOOST,
     DEFAULT_BRIGHTNESS_STEP,
     DEFAULT_COLOR_TEMP_STEP,
+    BRIGHTNESS_PCT_MAX,
+    BRIGHTNESS_PCT_MIN,
+    COLOR_TEMP_KELVIN_MAX,
+    COLOR_TEMP_KELVIN_MIN,
     MODE_ALIASES,
     DOMAIN,
     EVENT_MANUAL_DETECTED,
@@ -62,7 +70,6 @@ from ..const import (
     SERVICE_SELECT_SCENE,
     SYNC_TRANSITION_SEC,
 )
-from ..devices.zen32_handler import Zen32Config, Zen32Handler
 from ..features.environmental import EnvironmentalConfig, EnvironmentalObserver
 from ..features.manual_control import ManualControlConfig, ManualControlObserver
 from ..features.modes import ModeManager
@@ -78,8 +85,10 @@ from .event_bus import EventBus
 from .executors import ExecutorManager
 from .health_monitor import HealthMonitor
 from .timer_manager import TimerManager
-from .zone_manager import ZoneConfig, ZoneManager
+from .zone_manager import ZoneBoundaries, ZoneConfig, ZoneManager
 
+if TYPE_CHECKING:
+    from ..devices.zen32_handler import Zen32Handler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,23 +102,19 @@ class AdaptiveLightingProRuntime:
         self._data = dict(entry.data)
         self._options = dict(entry.options)
         self._debug_config = self._options.get(CONF_DEBUG, DEFAULT_DEBUG_CONFIG)
+        self._debug_enabled = bool(self._debug_config.get("debug_log", False))
         self._trace_enabled = bool(self._debug_config.get("trace_logbook", False))
         self._metrics = MetricsRegistry()
         self._counters = DailyCounters()
         self._health_monitor = HealthMonitor(self._metrics, self._counters)
         self._event_bus = EventBus(
             hass,
-            debug=bool(self._debug_config.get("debug_log", False)),
+            debug=self._debug_enabled,
             trace=self._trace_enabled,
         )
-        self._timer_manager = TimerManager(
-            hass, self._event_bus, debug=bool(self._debug_config.get("debug_log", False))
-        )
+        self._timer_manager = TimerManager(hass, self._event_bus, debug=self._debug_enabled)
         self._zone_manager = ZoneManager(self._timer_manager)
-        rate_conf = self._options.get(
-            CONF_RATE_LIMIT,
-            {"max_events": DEFAULT_RATE_LIMIT_MAX_EVENTS, "window_sec": DEFAULT_RATE_LIMIT_WINDOW},
-        )
+        rate_conf = self._options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)
         self._rate_limiter = RateLimiter(
             RateLimitConfig(
                 max_events=int(rate_conf.get("max_events", DEFAULT_RATE_LIMIT_MAX_EVENTS)),
@@ -121,18 +126,10 @@ class AdaptiveLightingProRuntime:
             hass,
             rate_limiter=self._rate_limiter,
             retry_manager=self._retry,
-            debug=bool(self._debug_config.get("debug_log", False)),
+            debug=self._debug_enabled,
         )
         self._mode_manager = ModeManager(self._event_bus, self._timer_manager)
-        scenes_options = self._options.get(CONF_SCENES, {})
-        order = list(scenes_options.get("order", DEFAULT_SCENE_ORDER))
-        preset_overrides = scenes_options.get("presets", {})
-        self._scene_presets = self._build_scene_presets(preset_overrides)
-        offsets_options = scenes_options.get("offsets", {})
-        self._scene_offset_user = {
-            "brightness": int(offsets_options.get("brightness", 0) or 0),
-            "warmth": int(offsets_options.get("warmth", 0) or 0),
-        }
+        order, self._scene_presets, self._scene_offset_user = self._parse_scene_options()
         self._scene_offsets = {"brightness": 0, "warmth": 0}
         self._manual_action_flags: Dict[str, bool] = {
             "brighter": False,
@@ -149,22 +146,20 @@ class AdaptiveLightingProRuntime:
             SceneConfig(
                 order=order,
                 force_apply=bool(self._options.get(CONF_FORCE_APPLY, DEFAULT_FORCE_APPLY)),
-                debug=bool(self._debug_config.get("debug_log", False)),
+                debug=self._debug_enabled,
                 presets=self._scene_presets,
                 user_offsets=dict(self._scene_offset_user),
                 offsets_callback=self._handle_scene_offsets_changed,
                 manual_action_callback=self._record_manual_action,
             ),
         )
-        self._scene_manager.update_user_offsets(
-            self._scene_offset_user["brightness"],
-            self._scene_offset_user["warmth"],
-        )
         self._mode_aliases = dict(MODE_ALIASES)
         self._sunset_boost_pct = 0
         self._sunset_active = False
-        self._zone_baselines: Dict[str, Dict[str, int]] = {}
-        self._current_zone_settings: Dict[str, Dict[str, int]] = {}
+        self._zone_baselines: Dict[str, ZoneBoundaries] = {}
+        self._zone_boost_ceilings: Dict[str, int] = {}
+        self._current_zone_settings: Dict[str, ZoneBoundaries] = {}
+        self._boundary_update_pending = False
         self._manual_observer: ManualControlObserver | None = None
         self._environmental: EnvironmentalObserver | None = None
         self._sonos: SonosSunriseCoordinator | None = None
@@ -175,6 +170,15 @@ class AdaptiveLightingProRuntime:
         self._backup_prefs: Dict[str, Any] | None = None
         self._services_registered = False
         self._zen32: Zen32Handler | None = None
+        self._zen32_buttons: Dict[
+            str, Callable[[str, str, bool, bool], Awaitable[bool]]
+        ] = {
+            "001": self._zen32_scene_cycle,
+            "002": self._zen32_brighter_or_warmer,
+            "003": self._zen32_reset,
+            "004": self._zen32_dimmer_or_cooler,
+            "005": self._zen32_toggle_all,
+        }
         self._previous_mode: str | None = None
         self._global_pause = False
         self._adjust_brightness_step = DEFAULT_BRIGHTNESS_STEP
@@ -210,8 +214,12 @@ class AdaptiveLightingProRuntime:
             self._nightly_unsub = None
 
     async def async_options_updated(self, entry: ConfigEntry) -> None:
+        if entry.options == self._options:
+            # Our own persisted writes (e.g. scene offsets) echo back unchanged.
+            return
         self._options = dict(entry.options)
         self._debug_config = self._options.get(CONF_DEBUG, DEFAULT_DEBUG_CONFIG)
+        self._debug_enabled = bool(self._debug_config.get("debug_log", False))
         self._apply_options()
         self._notify_entities()
 
@@ -224,13 +232,10 @@ class AdaptiveLightingProRuntime:
         overrides = self._options.get(CONF_PER_ZONE_OVERRIDES, {})
         if overrides:
             self._zone_manager.apply_overrides(overrides)
-        timeout_conf = self._options.get(
-            CONF_TIMEOUTS,
-            {"base_day_min": 60, "base_night_min": 180},
-        )
+        timeout_conf = self._options.get(CONF_TIMEOUTS, DEFAULT_TIMEOUTS)
         self._timer_manager.update_timeouts(
-            day_min=int(timeout_conf.get("base_day_min", 60)),
-            night_min=int(timeout_conf.get("base_night_min", 180)),
+            day_min=int(timeout_conf.get("base_day_min", DEFAULT_BASE_DAY_MIN)),
+            night_min=int(timeout_conf.get("base_night_min", DEFAULT_BASE_NIGHT_MIN)),
         )
         mode_mult = self._options.get(CONF_OPTIONS_MODE_MULTIPLIERS, DEFAULT_MODE_MULTIPLIERS)
         self._timer_manager.update_mode_multipliers(mode_mult)
@@ -241,7 +246,7 @@ class AdaptiveLightingProRuntime:
         self._mode_manager.ensure_valid_mode()
         self._health_monitor.set_rate_load(self._rate_limiter.load)
         self._load_scene_options()
-        asyncio.create_task(self._update_zone_boundaries())
+        self._schedule_zone_boundary_update()
         self._notify_entities()
 
     def _register_event_handlers(self) -> None:
@@ -263,7 +268,7 @@ class AdaptiveLightingProRuntime:
             self._event_bus,
             self._timer_manager,
             self._zone_manager,
-            ManualControlConfig(debug=bool(self._debug_config.get("debug_log", False))),
+            ManualControlConfig(debug=self._debug_enabled),
         )
         self._manual_observer.start()
         self._environmental = EnvironmentalObserver(
@@ -273,7 +278,7 @@ class AdaptiveLightingProRuntime:
             EnvironmentalConfig(
                 lux_entity=sensors.get("lux_entity"),
                 weather_entity=sensors.get("weather_entity"),
-                debug=bool(self._debug_config.get("debug_log", False)),
+                debug=self._debug_enabled,
             ),
         )
         self._environmental.start()
@@ -282,17 +287,19 @@ class AdaptiveLightingProRuntime:
             self._event_bus,
             self._zone_manager,
             SonosConfig(sensor=sensors.get("sonos_alarm_sensor")),
-            debug=bool(self._debug_config.get("debug_log", False)),
+            debug=self._debug_enabled,
         )
         self._sonos.start()
-        controller_conf = self._data.get(CONF_CONTROLLERS, {})
-        if controller_conf.get("zen32_device_id"):
+        zen32_device_id = self._data.get(CONF_CONTROLLERS, {}).get("zen32_device_id")
+        if zen32_device_id:
+            from ..devices.zen32_handler import Zen32Config, Zen32Handler
+
             self._zen32 = Zen32Handler(
                 self._hass,
                 self._event_bus,
                 Zen32Config(
-                    device_id=controller_conf.get("zen32_device_id"),
-                    debug=bool(self._debug_config.get("debug_log", False)),
+                    device_id=zen32_device_id,
+                    debug=self._debug_enabled,
                 ),
             )
             self._zen32.start()
@@ -306,7 +313,7 @@ class AdaptiveLightingProRuntime:
             self._hass,
             interval=interval,
             on_reset=lambda name: self._event_bus.post(EVENT_RESET_REQUESTED, scope=name),
-            debug=bool(self._debug_config.get("debug_log", False)),
+            debug=self._debug_enabled,
         )
         self._watchdog.start()
         self._beat("startup")
@@ -345,8 +352,7 @@ class AdaptiveLightingProRuntime:
         }
 
     def _handle_scene_offsets_changed(self, brightness: int, warmth: int) -> None:
-        brightness = int(brightness)
-        warmth = int(warmth)
+        # SceneManager.set_offsets coerces to int before invoking this callback.
         if (
             self._scene_offsets["brightness"] == brightness
             and self._scene_offsets["warmth"] == warmth
@@ -414,25 +420,33 @@ class AdaptiveLightingProRuntime:
         if warmth:
             self._record_manual_action("clear_warmth")
 
-    def _load_scene_options(self) -> None:
+    def _parse_scene_options(
+        self,
+    ) -> tuple[List[str], Dict[str, Dict[str, Any]], Dict[str, int]]:
+        """Return scene order, merged presets, and user offsets from options."""
+
         scenes_options = self._options.get(CONF_SCENES, {})
         order = list(scenes_options.get("order", DEFAULT_SCENE_ORDER))
-        self._scene_manager.update_order(order)
-        overrides = scenes_options.get("presets", {})
-        self._scene_presets = self._build_scene_presets(overrides)
-        self._scene_manager.update_presets(self._scene_presets)
+        presets = self._build_scene_presets(scenes_options.get("presets", {}))
         offsets_options = scenes_options.get("offsets", {})
-        self._scene_offset_user = {
+        user_offsets = {
             "brightness": int(offsets_options.get("brightness", 0) or 0),
             "warmth": int(offsets_options.get("warmth", 0) or 0),
         }
+        return order, presets, user_offsets
+
+    def _load_scene_options(self) -> None:
+        order, self._scene_presets, self._scene_offset_user = self._parse_scene_options()
+        self._scene_manager.update_order(order)
+        self._scene_manager.update_presets(self._scene_presets)
         self._scene_manager.update_user_offsets(
             self._scene_offset_user["brightness"],
             self._scene_offset_user["warmth"],
         )
 
     def _build_scene_presets(self, overrides: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-        presets = {scene: deepcopy(data) for scene, data in DEFAULT_SCENE_PRESETS.items()}
+        # Defaults are read-only; nested values are shared, never mutated downstream.
+        presets = {scene: dict(data) for scene, data in DEFAULT_SCENE_PRESETS.items()}
         for scene, data in overrides.items():
             base = presets.setdefault(scene, {})
             if not isinstance(data, dict):
@@ -442,59 +456,92 @@ class AdaptiveLightingProRuntime:
         return presets
 
     def _capture_zone_baselines(self) -> None:
-        baselines: Dict[str, Dict[str, int]] = {}
+        baselines: Dict[str, ZoneBoundaries] = {}
         for zone in self._zone_manager.zones():
             state = self._hass.states.get(zone.al_switch)
             attrs = getattr(state, "attributes", {}) if state else {}
-            baselines[zone.zone_id] = {
-                "min_brightness": self._safe_int(attrs.get("min_brightness"), 1),
-                "max_brightness": self._safe_int(attrs.get("max_brightness"), 100),
-                "min_color_temp": self._safe_int(attrs.get("min_color_temp"), 1800),
-                "max_color_temp": self._safe_int(attrs.get("max_color_temp"), 6500),
-            }
+            baselines[zone.zone_id] = ZoneBoundaries(
+                self._safe_int(attrs.get("min_brightness"), BRIGHTNESS_PCT_MIN),
+                self._safe_int(attrs.get("max_brightness"), BRIGHTNESS_PCT_MAX),
+                self._safe_int(attrs.get("min_color_temp"), COLOR_TEMP_KELVIN_MIN),
+                self._safe_int(attrs.get("max_color_temp"), COLOR_TEMP_KELVIN_MAX),
+            )
         self._zone_baselines = baselines
-        self._current_zone_settings = {
-            zone_id: dict(values) for zone_id, values in baselines.items()
+        self._zone_boost_ceilings = {
+            zone_id: max(values.min_brightness, values.max_brightness - 5)
+            for zone_id, values in baselines.items()
         }
+        self._current_zone_settings = dict(baselines)
+
+    def _schedule_zone_boundary_update(self) -> None:
+        """Queue one boundary pass, folding repeat requests made before it starts."""
+
+        if self._boundary_update_pending:
+            return
+        self._boundary_update_pending = True
+        self._hass.async_create_task(self._run_scheduled_boundary_update())
+
+    async def _run_scheduled_boundary_update(self) -> None:
+        self._boundary_update_pending = False
+        await self._update_zone_boundaries()
 
     async def _update_zone_boundaries(self) -> None:
         if not self._zone_baselines:
             return
-        tasks = []
+        zones_by_target: Dict[ZoneBoundaries, List[ZoneConfig]] = {}
+        active_boost = self._sunset_boost_pct if self._sunset_active else 0
+        ceilings = self._zone_boost_ceilings
+        baselines = self._zone_baselines
+        current_settings = self._current_zone_settings
+        manual_active = self._zone_manager.manual_active
         for zone in self._zone_manager.zones():
-            baseline = self._zone_baselines.get(zone.zone_id)
-            if not baseline:
+            zone_id = zone.zone_id
+            baseline = baselines.get(zone_id)
+            if baseline is None:
                 continue
-            target = dict(baseline)
-            boost = (
-                self._sunset_boost_pct
-                if self._sunset_active and zone.sunset_boost_enabled
-                else 0
-            )
-            if boost > 0:
-                max_allowed_min = max(
-                    baseline["min_brightness"], baseline["max_brightness"] - 5
+            if active_boost and zone.sunset_boost_enabled:
+                target = baseline._replace(
+                    min_brightness=min(
+                        ceilings[zone_id],
+                        baseline.min_brightness + active_boost,
+                    )
                 )
-                new_min = min(max_allowed_min, baseline["min_brightness"] + boost)
-                target["min_brightness"] = self._safe_int(new_min, baseline["min_brightness"])
-            current = self._current_zone_settings.get(zone.zone_id)
-            if current == target:
+            else:
+                target = baseline
+            # Manual zones are left unrecorded so they resync once released.
+            if manual_active(zone_id) or current_settings.get(zone_id) == target:
                 continue
-            self._current_zone_settings[zone.zone_id] = target
-            if self._zone_manager.manual_active(zone.zone_id):
+            current_settings[zone_id] = target
+            zones_by_target.setdefault(target, []).append(zone)
+        if not zones_by_target:
+            return
+        # Zones sharing identical boundaries are updated with one call.
+        results = await asyncio.gather(
+            *(
+                self._executors.change_switch_settings(
+                    zones[0].al_switch
+                    if len(zones) == 1
+                    else [zone.al_switch for zone in zones],
+                    {**target._asdict(), "transition": SYNC_TRANSITION_SEC},
+                )
+                for target, zones in zones_by_target.items()
+            ),
+            return_exceptions=True,
+        )
+        for zones, result in zip(zones_by_target.values(), results):
+            if isinstance(result, dict) and result.get("status") == "ok":
                 continue
-            payload = {
-                "min_brightness": target["min_brightness"],
-                "max_brightness": target["max_brightness"],
-                "min_color_temp": target["min_color_temp"],
-                "max_color_temp": target["max_color_temp"],
-                "transition": SYNC_TRANSITION_SEC,
-            }
-            tasks.append(
-                self._executors.change_switch_settings(zone.al_switch, payload)
+            error = (
+                result.get("error_code")
+                if isinstance(result, dict)
+                else result.__class__.__name__
             )
-        if tasks:
-            await asyncio.gather(*tasks)
+            for zone in zones:
+                # Forget the target so the next pass retries this zone.
+                self._current_zone_settings.pop(zone.zone_id, None)
+                _LOGGER.warning(
+                    "Boundary update failed for zone %s: %s", zone.zone_id, error
+                )
 
     @staticmethod
     def _safe_int(value: Any, default: int) -> int:
@@ -517,29 +564,35 @@ class AdaptiveLightingProRuntime:
                 return target
         return normalized
 
+    async def _release_manual_control(self, zones: Sequence[ZoneConfig]) -> None:
+        """Hand zones back to Adaptive Lighting with their current boundaries."""
+
+        for zone_conf in zones:
+            self._zone_manager.set_manual(zone_conf.zone_id, False)
+        await asyncio.gather(
+            *[
+                self._executors.set_manual_control(zone_conf.al_switch, False)
+                for zone_conf in zones
+            ]
+        )
+        # Boundary passes skip manual zones, so catch them up before any sync.
+        await self._update_zone_boundaries()
+
     async def _clear_manual_states(self) -> List[str]:
         cleared = self._zone_manager.clear_all_manuals()
         if cleared:
-            await asyncio.gather(
-                *[
-                    self._executors.set_manual_control(
-                        self._zone_manager.get_zone(zone_id).al_switch, False
-                    )
-                    for zone_id in cleared
-                ]
+            await self._release_manual_control(
+                [self._zone_manager.get_zone(zone_id) for zone_id in cleared]
             )
             self._previous_mode = None
             self._reset_manual_flags()
         return cleared
 
     async def _toggle_all_lights(self) -> None:
-        lights: List[str] = []
-        for zone in self._zone_manager.zones():
-            lights.extend(zone.lights)
-        unique = sorted({light for light in lights})
-        if not unique:
+        lights = self._zone_manager.all_lights()
+        if not lights:
             return
-        await self._executors.call_light_service("toggle", {"entity_id": unique})
+        await self._executors.call_light_service("toggle", {"entity_id": list(lights)})
 
     async def _restore_previous_mode_if_idle(self) -> None:
         if not self._previous_mode:
@@ -615,9 +668,7 @@ class AdaptiveLightingProRuntime:
 
     async def _handle_timer_expired(self, zone: str) -> None:
         self._beat("timer_expired")
-        zone_conf = self._zone_manager.get_zone(zone)
-        self._zone_manager.set_manual(zone, False)
-        await self._executors.set_manual_control(zone_conf.al_switch, False)
+        await self._release_manual_control([self._zone_manager.get_zone(zone)])
         await self._restore_previous_mode_if_idle()
         self._event_bus.post(EVENT_SYNC_REQUIRED, reason="timer", zone=zone)
         self._record_event("timer_expired", zone=zone)
@@ -676,10 +727,10 @@ class AdaptiveLightingProRuntime:
             return
         multiplier = payload.get("multiplier")
         self._timer_manager.set_environment(boost_active, multiplier=multiplier)
-        if boost_active:
+        if boost_active and _LOGGER.isEnabledFor(logging.DEBUG):
             for zone_conf in self._zone_manager.zones():
                 if not zone_conf.environmental_boost_enabled:
-                    _LOGGER.info(
+                    _LOGGER.debug(
                         "Environmental boost active but disabled for zone %s. Skipping timer multiplier.",
                         zone_conf.zone_id,
                     )
@@ -727,128 +778,169 @@ class AdaptiveLightingProRuntime:
         if action_norm.isdigit() and action_norm == "2":
             is_hold = True
 
-        if button_code == "001" and is_single:
-            if self._mode_manager.mode != "adaptive":
-                _LOGGER.info(
-                    "Zen32 scene cycle ignored in %s mode.", self._mode_manager.mode
-                )
-                self._record_event(
-                    "zen32_scene_blocked",
-                    button=button_code,
-                    action=action_raw,
-                    mode=self._mode_manager.mode,
-                )
-                return
-            await self._scene_manager.cycle()
-            self._record_event(
-                "zen32_scene_cycle", button=button_code, action=action_raw
-            )
-            return
-
-        if button_code == "002":
-            if is_hold:
-                await self.adjust(step_color_temp=-self._adjust_color_temp_step)
-                self._record_event(
-                    "zen32_adjust_warmer",
-                    button=button_code,
-                    action=action_raw,
-                    step=-self._adjust_color_temp_step,
-                )
-            elif is_single:
-                await self.adjust(step_brightness_pct=self._adjust_brightness_step)
-                self._record_event(
-                    "zen32_adjust_brighter",
-                    button=button_code,
-                    action=action_raw,
-                    step=self._adjust_brightness_step,
-                )
+        handler = self._zen32_buttons.get(button_code)
+        if handler is not None and await handler(
+            button_code, action_raw, is_single, is_hold
+        ):
             return
 
-        if button_code == "004":
-            if is_hold:
-                await self.adjust(step_color_temp=self._adjust_color_temp_step)
-                self._record_event(
-                    "zen32_adjust_cooler",
-                    button=button_code,
-                    action=action_raw,
-                    step=self._adjust_color_temp_step,
-                )
-            elif is_single:
-                await self.adjust(step_brightness_pct=-self._adjust_brightness_step)
-                self._record_event(
-                    "zen32_adjust_dimmer",
-                    button=button_code,
-                    action=action_raw,
-                    step=-self._adjust_brightness_step,
-                )
-            return
+        _LOGGER.debug(
+            "Unhandled Zen32 input button=%s action=%s", button_code, action_raw
+        )
 
-        if button_code == "003":
-            await self.select_mode("adaptive")
-            scene_result = await self.select_scene("default")
+    async def _zen32_scene_cycle(
+        self, button_code: str, action_raw: str, is_single: bool, is_hold: bool
+    ) -> bool:
+        if not is_single:
+            return False
+        if self._mode_manager.mode != "adaptive":
+            _LOGGER.info(
+                "Zen32 scene cycle ignored in %s mode.", self._mode_manager.mode
+            )
             self._record_event(
-                "zen32_reset",
+                "zen32_scene_blocked",
                 button=button_code,
                 action=action_raw,
-                cleared=scene_result.get("cleared", 0),
+                mode=self._mode_manager.mode,
             )
-            return
+            return True
+        await self._scene_manager.cycle()
+        self._record_event("zen32_scene_cycle", button=button_code, action=action_raw)
+        return True
+
+    async def _zen32_brighter_or_warmer(
+        self, button_code: str, action_raw: str, is_single: bool, is_hold: bool
+    ) -> bool:
+        if is_hold:
+            await self.adjust(step_color_temp=-self._adjust_color_temp_step)
+            self._record_event(
+                "zen32_adjust_warmer",
+                button=button_code,
+                action=action_raw,
+                step=-self._adjust_color_temp_step,
+            )
+        elif is_single:
+            await self.adjust(step_brightness_pct=self._adjust_brightness_step)
+            self._record_event(
+                "zen32_adjust_brighter",
+                button=button_code,
+                action=action_raw,
+                step=self._adjust_brightness_step,
+            )
+        return True
 
-        if button_code == "005" and is_single:
-            await self._toggle_all_lights()
+    async def _zen32_dimmer_or_cooler(
+        self, button_code: str, action_raw: str, is_single: bool, is_hold: bool
+    ) -> bool:
+        if is_hold:
+            await self.adjust(step_color_temp=self._adjust_color_temp_step)
             self._record_event(
-                "zen32_toggle_all", button=button_code, action=action_raw
+                "zen32_adjust_cooler",
+                button=button_code,
+                action=action_raw,
+                step=self._adjust_color_temp_step,
             )
-            return
+        elif is_single:
+            await self.adjust(step_brightness_pct=-self._adjust_brightness_step)
+            self._record_event(
+                "zen32_adjust_dimmer",
+                button=button_code,
+                action=action_raw,
+                step=-self._adjust_brightness_step,
+            )
+        return True
 
-        _LOGGER.debug(
-            "Unhandled Zen32 input button=%s action=%s", button_code, action_raw
+    async def _zen32_reset(
+        self, button_code: str, action_raw: str, is_single: bool, is_hold: bool
+    ) -> bool:
+        await self.select_mode("adaptive")
+        scene_result = await self.select_scene("default")
+        self._record_event(
+            "zen32_reset",
+            button=button_code,
+            action=action_raw,
+            cleared=scene_result.get("cleared", 0),
         )
+        return True
+
+    async def _zen32_toggle_all(
+        self, button_code: str, action_raw: str, is_single: bool, is_hold: bool
+    ) -> bool:
+        if not is_single:
+            return False
+        await self._toggle_all_lights()
+        self._record_event("zen32_toggle_all", button=button_code, action=action_raw)
+        return True
 
     async def force_sync(self, zone: str | None = None) -> Dict[str, Any]:
-        self._beat("force_sync")
-        if self._global_pause:
-            self._record_event("sync_skipped_paused", zone=zone)
-            return {"status": "error", "error_code": "PAUSED"}
         zones = (
             [self._zone_manager.get_zone(zone)]
             if zone
             else self._zone_manager.enabled_zones()
         )
-        results = []
+        return await self._sync_zones(zones, zone)
+
+    async def _sync_zones(
+        self, zones: Sequence[ZoneConfig], zone: str | None = None
+    ) -> Dict[str, Any]:
+        self._beat("force_sync")
+        if self._global_pause:
+            self._record_event("sync_skipped_paused", zone=zone)
+            return {"status": "error", "error_code": "PAUSED"}
+        force_flag = self._options.get(CONF_FORCE_APPLY, DEFAULT_FORCE_APPLY)
+        targets = [
+            zone_conf
+            for zone_conf in zones
+            if not self._zone_manager.manual_active(zone_conf.zone_id)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._executors.apply(
+                    zone_conf.al_switch,
+                    {
+                        "transition": SYNC_TRANSITION_SEC,
+                        "lights": zone_conf.lights,
+                        "force": force_flag,
+                    },
+                )
+                for zone_conf in targets
+            )
+        )
         rate_limited = False
-        for zone_conf in zones:
-            if self._zone_manager.manual_active(zone_conf.zone_id):
-                continue
-            payload = {
-                "transition": SYNC_TRANSITION_SEC,
-                "lights": zone_conf.lights,
-                "force": self._options.get(CONF_FORCE_APPLY, DEFAULT_FORCE_APPLY),
-            }
-            result = await self._executors.apply(zone_conf.al_switch, payload)
-            if result.get("error_code") == "RATE_LIMITED":
+        for zone_conf, result in zip(targets, results):
+            if self._record_apply_result(zone_conf.zone_id, result):
                 rate_limited = True
-                self._counters.increment("rate_limited")
-            self._metrics.record_sync(result.get("duration_ms", 0), failed=result.get("status") != "ok")
-            self._zone_manager.update_sync_result(
-                zone_conf.zone_id,
-                result.get("duration_ms", 0),
-                result.get("error_code"),
-            )
-            results.append(result)
         self._rate_limit_reached = rate_limited
         self._health_monitor.set_rate_load(self._rate_limiter.load)
         self._counters.increment("sync_requests")
         self._notify_entities()
         return {"status": "ok", "results": results}
 
+    def _record_apply_result(self, zone_id: str, result: Dict[str, Any]) -> bool:
+        """Record metrics for an executor apply and report rate limiting."""
+
+        duration_ms = result.get("duration_ms", 0)
+        error_code = result.get("error_code")
+        rate_limited = error_code == "RATE_LIMITED"
+        if rate_limited:
+            self._counters.increment("rate_limited")
+        self._metrics.record_sync(duration_ms, failed=result.get("status") != "ok")
+        self._zone_manager.update_sync_result(zone_id, duration_ms, error_code)
+        return rate_limited
+
     async def reset_zone(self, zone: str) -> Dict[str, Any]:
-        zone_conf = self._zone_manager.get_zone(zone)
-        self._zone_manager.set_manual(zone, False)
-        await self._executors.set_manual_control(zone_conf.al_switch, False)
+        await self._release_manual_control([self._zone_manager.get_zone(zone)])
         await self.force_sync(zone)
         return {"status": "ok"}
 
+    async def reset_all_zones(self) -> Dict[str, Any]:
+        """Clear manual control on every zone and resync all of them in one pass."""
+
+        zones = self._zone_manager.zones()
+        await self._release_manual_control(zones)
+        await self._sync_zones(zones)
+        return {"status": "ok"}
+
     async def enable_zone(self, zone: str) -> Dict[str, Any]:
         self._zone_manager.set_enabled(zone, True)
         await self.force_sync(zone)
@@ -930,7 +1022,9 @@ class AdaptiveLightingProRuntime:
 
             if step_brightness_pct is not None:
                 current = self._current_brightness_pct(zone_conf)
-                brightness_target = self._clamp(current + step_brightness_pct, 1, 100)
+                brightness_target = self._clamp(
+                    current + step_brightness_pct, BRIGHTNESS_PCT_MIN, BRIGHTNESS_PCT_MAX
+                )
                 payload["brightness_pct"] = brightness_target
                 payload["adapt_brightness"] = False
                 payload["context"]["brightness_step_pct"] = step_brightness_pct
@@ -938,7 +1032,11 @@ class AdaptiveLightingProRuntime:
 
             if step_color_temp is not None:
                 current_kelvin = self._current_color_temp_kelvin(zone_conf)
-                color_target = self._clamp(current_kelvin + step_color_temp, 1800, 6500)
+                color_target = self._clamp(
+                    current_kelvin + step_color_temp,
+                    COLOR_TEMP_KELVIN_MIN,
+                    COLOR_TEMP_KELVIN_MAX,
+                )
                 payload["color_temp_kelvin"] = color_target
                 payload["adapt_color_temp"] = False
                 payload["context"]["color_temp_step"] = step_color_temp
@@ -961,17 +1059,8 @@ class AdaptiveLightingProRuntime:
                 duration_s=duration,
             )
             result = await self._executors.apply(zone_conf.al_switch, payload)
-            if result.get("error_code") == "RATE_LIMITED":
+            if self._record_apply_result(zone_conf.zone_id, result):
                 rate_limited = True
-                self._counters.increment("rate_limited")
-            self._metrics.record_sync(
-                result.get("duration_ms", 0), failed=result.get("status") != "ok"
-            )
-            self._zone_manager.update_sync_result(
-                zone_conf.zone_id,
-                result.get("duration_ms", 0),
-                result.get("error_code"),
-            )
             results.append(result)
 
         if not applied:
@@ -1019,9 +1108,21 @@ class AdaptiveLightingProRuntime:
     def zone_states(self) -> Dict[str, Dict[str, Any]]:
         return self._zone_manager.as_dict()
 
+    def zone_manual_active(self, zone_id: str) -> bool:
+        return self._zone_manager.manual_active(zone_id)
+
+    def zone_manual_duration(self, zone_id: str) -> int:
+        return self._zone_manager.manual_duration(zone_id)
+
     def manual_action_flags(self) -> Dict[str, bool]:
         return dict(self._manual_action_flags)
 
+    def manual_action_active(self, action: str) -> bool:
+        return self._manual_action_flags.get(action, False)
+
+    def rate_window_load(self) -> float:
+        return self._health_monitor.rate_window_load
+
     def available_modes(self) -> List[str]:
         """Expose available modes to Home Assistant platforms."""
 
@@ -1052,10 +1153,10 @@ class AdaptiveLightingProRuntime:
         return dict(self._scene_offsets)
 
     def scene_brightness_offset(self) -> int:
-        return int(self._scene_offset_user["brightness"])
+        return self._scene_offset_user["brightness"]
 
     def scene_warmth_offset(self) -> int:
-        return int(self._scene_offset_user["warmth"])
+        return self._scene_offset_user["warmth"]
 
     def set_scene_brightness_offset(self, value: float) -> None:
         brightness = int(value)
@@ -1082,8 +1183,8 @@ class AdaptiveLightingProRuntime:
     def _persist_scene_offsets(self) -> None:
         scenes_options = dict(self._options.get(CONF_SCENES, {}))
         offsets = dict(scenes_options.get("offsets", {}))
-        offsets["brightness"] = int(self._scene_offset_user["brightness"])
-        offsets["warmth"] = int(self._scene_offset_user["warmth"])
+        offsets["brightness"] = self._scene_offset_user["brightness"]
+        offsets["warmth"] = self._scene_offset_user["warmth"]
         scenes_options["offsets"] = offsets
         self._options[CONF_SCENES] = scenes_options
         self._hass.config_entries.async_update_entry(
@@ -1109,25 +1210,34 @@ class AdaptiveLightingProRuntime:
         return self._adjust_color_temp_step
 
     def set_adjust_brightness_step(self, value: float) -> None:
-        self._adjust_brightness_step = int(value)
-        self._record_event("adjust_step_updated", brightness_step=int(value))
+        step = int(value)
+        if step == self._adjust_brightness_step:
+            return
+        self._adjust_brightness_step = step
+        self._record_event("adjust_step_updated", brightness_step=step)
         self._notify_entities()
 
     def set_adjust_color_temp_step(self, value: float) -> None:
-        self._adjust_color_temp_step = int(value)
-        self._record_event("adjust_step_updated", color_temp_step=int(value))
+        step = int(value)
+        if step == self._adjust_color_temp_step:
+            return
+        self._adjust_color_temp_step = step
+        self._record_event("adjust_step_updated", color_temp_step=step)
         self._notify_entities()
 
     def telemetry_snapshot(self) -> Dict[str, Any]:
-        zone_data = self.zone_states()
-        manual_zones = [zone for zone, data in zone_data.items() if data.get("manual_active")]
-        enabled_zones = [zone for zone, data in zone_data.items() if data.get("enabled")]
-        last_syncs = {zone: data.get("last_sync_ms") for zone, data in zone_data.items()}
-        last_errors = {
-            zone: data.get("last_error")
-            for zone, data in zone_data.items()
-            if data.get("last_error")
-        }
+        manual_zones: List[str] = []
+        enabled_zones: List[str] = []
+        last_syncs: Dict[str, Any] = {}
+        last_errors: Dict[str, Any] = {}
+        for zone, data in self.zone_states().items():
+            if data["manual_active"]:
+                manual_zones.append(zone)
+            if data["enabled"]:
+                enabled_zones.append(zone)
+            last_syncs[zone] = data["last_sync_ms"]
+            if data["last_error"]:
+                last_errors[zone] = data["last_error"]
         summary = self.analytics_summary()
         telemetry = {
             "state": "paused" if self._global_pause else "active",
@@ -1157,6 +1267,8 @@ class AdaptiveLightingProRuntime:
         """Update a zone's sunrise offset and refresh dependent schedulers."""
 
         offset = int(value)
+        if offset == self._zone_manager.sunrise_offset(zone_id):
+            return
         self._zone_manager.update_zone(zone_id, sunrise_offset_min=offset)
         if self._sonos:
             self._sonos.refresh()
@@ -1172,6 +1284,8 @@ class AdaptiveLightingProRuntime:
         """Persist a new zone multiplier and update timers."""
 
         multiplier = float(value)
+        if multiplier == self._zone_manager.zone_multiplier(zone_id):
+            return
         self._zone_manager.update_zone(zone_id, zone_multiplier=multiplier)
         self._record_event("zone_multiplier_updated", zone=zone_id, multiplier=multiplier)
         self._notify_entities()
@@ -1185,7 +1299,12 @@ class AdaptiveLightingProRuntime:
             state = self._hass.states.get(entity_id)
             if state and "brightness" in state.attributes:
                 brightness = int(state.attributes["brightness"])
-                return self._clamp(round(brightness / 255 * 100), 1, 100)
+                # Integer rounding; brightness * 100 / 255 never lands on .5.
+                return self._clamp(
+                    (brightness * 100 + 127) // 255,
+                    BRIGHTNESS_PCT_MIN,
+                    BRIGHTNESS_PCT_MAX,
+                )
         return 50
 
     def _current_color_temp_kelvin(self, zone_conf: ZoneConfig) -> int:
@@ -1194,12 +1313,18 @@ class AdaptiveLightingProRuntime:
             if not state:
                 continue
             if "color_temp_kelvin" in state.attributes:
-                return self._clamp(int(state.attributes["color_temp_kelvin"]), 1800, 6500)
+                return self._clamp(
+                    int(state.attributes["color_temp_kelvin"]),
+                    COLOR_TEMP_KELVIN_MIN,
+                    COLOR_TEMP_KELVIN_MAX,
+                )
             if "color_temp" in state.attributes and state.attributes["color_temp"]:
                 try:
                     mired = float(state.attributes["color_temp"])
                     kelvin = int(round(1_000_000 / mired))
-                    return self._clamp(kelvin, 1800, 6500)
+                    return self._clamp(
+                        kelvin, COLOR_TEMP_KELVIN_MIN, COLOR_TEMP_KELVIN_MAX
+                    )
                 except (ValueError, ZeroDivisionError, TypeError):
                     continue
         return 3000
@@ -85,18 +85,19 @@ class TimerManager:
             if env_allowed and self._env_boost_active and self._current_mode == "adaptive"
             else 1.0
         )
-        if self._env_boost_active and not env_allowed:
-            log_debug(
-                self._debug,
-                "Environment boost suppressed for zone=%s", zone_id,
-            )
-        if self._env_boost_active and self._current_mode != "adaptive":
-            log_debug(
-                self._debug,
-                "Environment boost suppressed by mode=%s", self._current_mode,
-            )
         duration_min = base_min * mode_multiplier * env_multiplier * zone_multiplier
         duration_s = max(1, int(duration_min * 60))
+        if self._debug and self._env_boost_active:
+            if not env_allowed:
+                log_debug(
+                    self._debug,
+                    "Environment boost suppressed for zone=%s", zone_id,
+                )
+            if self._current_mode != "adaptive":
+                log_debug(
+                    self._debug,
+                    "Environment boost suppressed by mode=%s", self._current_mode,
+                )
         log_debug(
             self._debug,
             "Timer duration zone=%s base=%s mode=%s env=%s zone_mult=%s -> %s",
@@ -3,10 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, NamedTuple, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneConfig:
     zone_id: str
     al_switch: str
@@ -18,7 +18,7 @@ class ZoneConfig:
     sunset_boost_enabled: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneState:
     manual_active: bool = False
     manual_duration: int = 0
@@ -27,6 +27,13 @@ class ZoneState:
     last_error: str | None = None
 
 
+class ZoneBoundaries(NamedTuple):
+    min_brightness: int
+    max_brightness: int
+    min_color_temp: int
+    max_color_temp: int
+
+
 class ZoneManager:
     """Manage zone configs and runtime state."""
 
@@ -34,10 +41,15 @@ class ZoneManager:
         self._timer_manager = timer_manager
         self._zones: Dict[str, ZoneConfig] = {}
         self._states: Dict[str, ZoneState] = {}
+        self._all_lights: Tuple[str, ...] | None = None
+        self._zone_list: Tuple[ZoneConfig, ...] = ()
+        self._enabled_zones: Tuple[ZoneConfig, ...] | None = None
 
     def load_zones(self, zones: Iterable[dict]) -> None:
         self._zones.clear()
         self._states.clear()
+        self._all_lights = None
+        self._enabled_zones = None
         for zone in zones:
             config = ZoneConfig(
                 zone_id=zone["zone_id"],
@@ -58,11 +70,16 @@ class ZoneManager:
                 config.zone_multiplier,
                 env_enabled=config.environmental_boost_enabled,
             )
+        self._zone_list = tuple(self._zones.values())
 
     def update_zone(self, zone_id: str, **changes) -> None:
         config = self._zones[zone_id]
         for key, value in changes.items():
             setattr(config, key, value)
+        if "lights" in changes:
+            self._all_lights = None
+        if "enabled" in changes:
+            self._enabled_zones = None
         self._timer_manager.configure_zone(
             zone_id,
             config.zone_multiplier,
@@ -71,15 +88,29 @@ class ZoneManager:
 
     def set_enabled(self, zone_id: str, enabled: bool) -> None:
         self._zones[zone_id].enabled = enabled
+        self._enabled_zones = None
 
     def get_zone(self, zone_id: str) -> ZoneConfig:
         return self._zones[zone_id]
 
-    def zones(self) -> List[ZoneConfig]:
-        return list(self._zones.values())
+    def zones(self) -> Tuple[ZoneConfig, ...]:
+        return self._zone_list
+
+    def enabled_zones(self) -> Tuple[ZoneConfig, ...]:
+        if self._enabled_zones is None:
+            self._enabled_zones = tuple(
+                zone for zone in self._zone_list if zone.enabled
+            )
+        return self._enabled_zones
 
-    def enabled_zones(self) -> List[ZoneConfig]:
-        return [zone for zone in self._zones.values() if zone.enabled]
+    def all_lights(self) -> Tuple[str, ...]:
+        """Return every configured light once, sorted, across all zones."""
+
+        if self._all_lights is None:
+            self._all_lights = tuple(
+                sorted({light for zone in self._zones.values() for light in zone.lights})
+            )
+        return self._all_lights
 
     def set_manual(self, zone_id: str, active: bool, duration: int = 0) -> None:
         state = self._states[zone_id]
@@ -103,6 +134,9 @@ class ZoneManager:
     def manual_active(self, zone_id: str) -> bool:
         return self._states[zone_id].manual_active
 
+    def manual_duration(self, zone_id: str) -> int:
+        return self._states[zone_id].manual_duration
+
     def update_sync_result(self, zone_id: str, duration_ms: int, error: str | None) -> None:
         state = self._states[zone_id]
         state.last_sync_ms = duration_ms
@@ -121,6 +155,7 @@ class ZoneManager:
             config = self._zones[zone_id]
             if "enabled" in override:
                 config.enabled = bool(override["enabled"])
+                self._enabled_zones = None
             if "zone_multiplier" in override:
                 config.zone_multiplier = float(override["zone_multiplier"])
             if "sunrise_offset_min" in override:
@@ -2,9 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Callable, Dict, List
 
-from ..const import EVENT_MANUAL_DETECTED, EVENT_SCENE_CHANGED, SYNC_TRANSITION_SEC
+from ..const import (
+    BRIGHTNESS_PCT_MAX,
+    BRIGHTNESS_PCT_MIN,
+    COLOR_TEMP_KELVIN_MAX,
+    COLOR_TEMP_KELVIN_MIN,
+    EVENT_MANUAL_DETECTED,
+    EVENT_SCENE_CHANGED,
+    SYNC_TRANSITION_SEC,
+)
 from ..utils.logger import log_debug
 
 
@@ -21,10 +30,26 @@ class SceneConfig:
     manual_action_callback: Callable[[str], None] = field(default=lambda _action: None)
 
 
-SCENE_GROUPS = {
-    "all_lights": ("turn_on", "group.all_lights"),
-    "no_spots": ("turn_off", "group.no_spots"),
-}
+SCENE_GROUPS = MappingProxyType(
+    {
+        "all_lights": ("turn_on", "group.all_lights"),
+        "no_spots": ("turn_off", "group.no_spots"),
+    }
+)
+
+
+_PRESET_RESERVED_KEYS = frozenset(
+    {
+        "brightness_pct",
+        "color_temp_kelvin",
+        "adapt_brightness",
+        "adapt_color_temp",
+        "manual",
+        "actions",
+        "offsets",
+        "transition",
+    }
+)
 
 
 class SceneManager:
@@ -136,6 +161,47 @@ class SceneManager:
 
         await self._execute_actions(preset.get("actions", []))
 
+        # Everything below is zone-independent; resolve it once per scene.
+        transition = preset.get("transition", SYNC_TRANSITION_SEC)
+        turn_on_lights = preset.get("turn_on_lights", True)
+        manual_scene = bool(preset.get("manual", scene != "default"))
+        settings: Dict[str, Any] = {}
+        context_settings: Dict[str, Any] = {}
+        scene_offsets = dict(self._offsets)
+        scene_user_offsets = dict(self._user_offsets)
+
+        brightness = preset.get("brightness_pct")
+        if brightness is not None:
+            brightness = self._clamp(
+                int(brightness) + self._offsets["brightness"],
+                BRIGHTNESS_PCT_MIN,
+                BRIGHTNESS_PCT_MAX,
+            )
+            settings["brightness_pct"] = brightness
+            settings["adapt_brightness"] = False
+            context_settings["brightness_pct"] = brightness
+        else:
+            adapt_brightness = bool(preset.get("adapt_brightness", False))
+            settings["adapt_brightness"] = adapt_brightness or scene == "default"
+
+        color_temp = preset.get("color_temp_kelvin")
+        if color_temp is not None:
+            color_temp = self._clamp(
+                int(color_temp) + self._offsets["warmth"],
+                COLOR_TEMP_KELVIN_MIN,
+                COLOR_TEMP_KELVIN_MAX,
+            )
+            settings["color_temp_kelvin"] = color_temp
+            settings["adapt_color_temp"] = False
+            context_settings["color_temp_kelvin"] = color_temp
+        else:
+            adapt_color = bool(preset.get("adapt_color_temp", False))
+            settings["adapt_color_temp"] = adapt_color or scene == "default"
+
+        settings.update(
+            (key, value) for key, value in preset.items() if key not in _PRESET_RESERVED_KEYS
+        )
+
         for zone in self._zone_manager.enabled_zones():
             if self._zone_manager.manual_active(zone.zone_id):
                 log_debug(
@@ -145,20 +211,20 @@ class SceneManager:
                     zone.zone_id,
                 )
                 continue
+            context: Dict[str, Any] = {
+                "source": "alp_scene",
+                "scene": scene,
+                "zone": zone.zone_id,
+                "scene_offsets": scene_offsets,
+                "scene_user_offsets": scene_user_offsets,
+            }
             data = {
-                "transition": preset.get("transition", SYNC_TRANSITION_SEC),
+                "transition": transition,
                 "lights": zone.lights,
                 "force": self._config.force_apply,
-                "turn_on_lights": preset.get("turn_on_lights", True),
-                "context": {
-                    "source": "alp_scene",
-                    "scene": scene,
-                    "zone": zone.zone_id,
-                    "scene_offsets": dict(self._offsets),
-                    "scene_user_offsets": dict(self._user_offsets),
-                },
+                "turn_on_lights": turn_on_lights,
+                "context": context,
             }
-            manual_scene = bool(preset.get("manual", scene != "default"))
             if manual_scene:
                 duration = self._timer_manager.compute_duration_seconds(zone.zone_id)
                 self._event_bus.post(
@@ -166,49 +232,9 @@ class SceneManager:
                     zone=zone.zone_id,
                     duration_s=duration,
                 )
-                data["context"]["manual_duration_s"] = duration
-
-            brightness = preset.get("brightness_pct")
-            if brightness is not None:
-                brightness = self._clamp(
-                    int(brightness) + self._offsets["brightness"], 1, 100
-                )
-                data["brightness_pct"] = brightness
-                data["adapt_brightness"] = False
-                data["context"]["brightness_pct"] = brightness
-            else:
-                adapt_brightness = bool(preset.get("adapt_brightness", False))
-                data["adapt_brightness"] = adapt_brightness or scene == "default"
-
-            color_temp = preset.get("color_temp_kelvin")
-            if color_temp is not None:
-                color_temp = self._clamp(
-                    int(color_temp) + self._offsets["warmth"], 1800, 6500
-                )
-                data["color_temp_kelvin"] = color_temp
-                data["adapt_color_temp"] = False
-                data["context"]["color_temp_kelvin"] = color_temp
-            else:
-                adapt_color = bool(preset.get("adapt_color_temp", False))
-                data["adapt_color_temp"] = adapt_color or scene == "default"
-
-            extras = {
-                key: value
-                for key, value in preset.items()
-                if key
-                not in {
-                    "brightness_pct",
-                    "color_temp_kelvin",
-                    "adapt_brightness",
-                    "adapt_color_temp",
-                    "manual",
-                    "actions",
-                    "offsets",
-                    "transition",
-                }
-            }
-            if extras:
-                data.update(extras)
+                context["manual_duration_s"] = duration
+            context.update(context_settings)
+            data.update(settings)
             await self._executors.apply(zone.al_switch, data)
 
     def _combine_offsets(
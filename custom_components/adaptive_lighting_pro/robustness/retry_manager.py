@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import random
-from typing import Awaitable, Callable, TypeVar
+from typing import Awaitable, Callable, Sequence, TypeVar
 
 T = TypeVar("T")
 
@@ -11,7 +11,7 @@ T = TypeVar("T")
 class RetryManager:
     """Retry helper supporting exponential backoff with jitter."""
 
-    def __init__(self, attempts: int, backoffs: list[int]) -> None:
+    def __init__(self, attempts: int, backoffs: Sequence[int]) -> None:
         self._attempts = attempts
         self._backoffs = backoffs
 
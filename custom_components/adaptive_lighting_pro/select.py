@@ -30,10 +30,7 @@ class AdaptiveLightingProModeSelect(AdaptiveLightingProEntity, SelectEntity):
 
     def __init__(self, runtime) -> None:
         super().__init__(runtime, "ALP Mode", MODE_SELECT_ID)
-
-    @property
-    def options(self) -> list[str]:
-        return self._runtime.available_modes()
+        self._attr_options = self._runtime.available_modes()
 
     @property
     def current_option(self) -> str:
@@ -54,11 +51,7 @@ class AdaptiveLightingProSceneSelect(AdaptiveLightingProEntity, SelectEntity):
 
     def __init__(self, runtime) -> None:
         super().__init__(runtime, "ALP Scene", SCENE_SELECT_ID)
-
-    @property
-    def options(self) -> list[str]:
-        options = self._runtime.available_scenes()
-        return options or DEFAULT_SCENE_ORDER
+        self._attr_options = self._scene_options()
 
     @property
     def current_option(self) -> str:
@@ -68,5 +61,8 @@ class AdaptiveLightingProSceneSelect(AdaptiveLightingProEntity, SelectEntity):
         await self._runtime.select_scene(option)
 
     def _handle_update(self) -> None:
-        self._attr_options = self.options
+        self._attr_options = self._scene_options()
         super()._handle_update()
+
+    def _scene_options(self) -> list[str]:
+        return self._runtime.available_scenes() or list(DEFAULT_SCENE_ORDER)
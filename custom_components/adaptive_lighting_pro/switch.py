@@ -19,8 +19,10 @@ async def async_setup_entry(
     runtime = hass.data[DOMAIN][entry.entry_id]
     entities = [
         AdaptiveLightingProGlobalPauseSwitch(runtime),
-        AdaptiveLightingProZoneSwitch(runtime, zone_id)
-        for zone_id in runtime.zone_states().keys()
+        *(
+            AdaptiveLightingProZoneSwitch(runtime, zone_id)
+            for zone_id in runtime.zone_states()
+        ),
     ]
     async_add_entities(entities)
 
@@ -5,7 +5,10 @@ from typing import Iterable, List
 
 from homeassistant.core import HomeAssistant
 
-from ..const import DOMAIN
+from ..const import DEFAULT_MODE_MULTIPLIERS, DEFAULT_SCENE_ORDER, DOMAIN
+
+_VALID_MODES = frozenset(DEFAULT_MODE_MULTIPLIERS)
+_VALID_SCENES = frozenset(DEFAULT_SCENE_ORDER)
 
 
 class ValidationError(Exception):
@@ -52,8 +55,9 @@ def validate_zone_id(zone_id: str, existing: Iterable[str]) -> str:
 
 
 def ensure_not_empty(value: Iterable[object], field: str) -> None:
-    if not list(value):
-        raise ValidationError(field, f"{field} cannot be empty")
+    for _ in value:
+        return
+    raise ValidationError(field, f"{field} cannot be empty")
 
 
 def ensure_uuid(value: str) -> str:
@@ -104,14 +108,12 @@ def validate_rate_limit(config: dict) -> dict:
 
 
 def validate_mode(mode: str) -> str:
-    valid = {"adaptive", "work", "focus", "relax", "movie", "late_night"}
-    if mode not in valid:
+    if mode not in _VALID_MODES:
         raise ValidationError("mode", f"Unknown mode {mode}")
     return mode
 
 
 def validate_scene(scene: str) -> str:
-    valid = {"default", "all_lights", "no_spots", "evening_comfort", "ultra_dim"}
-    if scene not in valid:
+    if scene not in _VALID_SCENES:
         raise ValidationError("scene", f"Unknown scene {scene}")
     return scene
@@ -31,6 +31,11 @@ async def _setup_runtime(
     return runtime
 
 
+async def _drain_pending_tasks() -> None:
+    pending = asyncio.all_tasks() - {asyncio.current_task()}
+    await asyncio.gather(*pending)
+
+
 def test_adjust_service_applies_deltas_and_triggers_manual(hass: HomeAssistant) -> None:
     async def scenario() -> None:
         zones = [
@@ -84,6 +89,9 @@ def test_adjust_service_applies_deltas_and_triggers_manual(hass: HomeAssistant)
         flags = runtime.manual_action_flags()
         assert flags["brighter"] is True
         assert flags["warmer"] is True
+        assert runtime.zone_manual_active("living")
+        assert runtime.manual_action_active("brighter")
+        assert not runtime.manual_action_active("dimmer")
 
     hass.loop.run_until_complete(scenario())
 
@@ -242,3 +250,169 @@ def test_force_sync_rate_limit_flag_across_zones(hass: HomeAssistant) -> None:
         assert runtime.rate_limit_reached() is False
 
     hass.loop.run_until_complete(scenario())
+
+
+def test_reset_all_zones_clears_manual_and_syncs_once(hass: HomeAssistant) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": zone_id,
+                "al_switch": f"switch.{zone_id}",
+                "lights": [f"light.{zone_id}"],
+                "enabled": zone_id != "bedroom",
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+            for zone_id in ("living", "kitchen", "bedroom")
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        apply_calls: list[str] = []
+        manual_calls: list[tuple[str, bool]] = []
+
+        async def fake_apply(entity_id: str, data: dict) -> dict:
+            apply_calls.append(entity_id)
+            return {"status": "ok", "duration_ms": 5}
+
+        async def fake_manual(entity_id: str, manual: bool) -> dict:
+            manual_calls.append((entity_id, manual))
+            return {"status": "ok"}
+
+        runtime._executors.apply = fake_apply  # type: ignore[assignment]
+        runtime._executors.set_manual_control = fake_manual  # type: ignore[assignment]
+
+        runtime._zone_manager.set_manual("living", True, 30)
+        runtime._zone_manager.set_manual("kitchen", True, 30)
+
+        result = await runtime.reset_all_zones()
+
+        assert result["status"] == "ok"
+        assert not runtime.zone_manual_active("living")
+        assert not runtime.zone_manual_active("kitchen")
+        assert sorted(manual_calls) == [
+            ("switch.bedroom", False),
+            ("switch.kitchen", False),
+            ("switch.living", False),
+        ]
+        # Disabled zones are resynced too, matching the per-zone reset path.
+        assert sorted(apply_calls) == [
+            "switch.bedroom",
+            "switch.kitchen",
+            "switch.living",
+        ]
+
+    hass.loop.run_until_complete(scenario())
+
+
+def test_options_update_skips_reapply_when_unchanged(hass: HomeAssistant) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": "living",
+                "al_switch": "switch.living",
+                "lights": ["light.one"],
+                "enabled": True,
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        async def fake_call(*args) -> dict:
+            return {"status": "ok", "duration_ms": 5}
+
+        runtime._executors.apply = fake_call  # type: ignore[assignment]
+        runtime._executors.call_light_service = fake_call  # type: ignore[assignment]
+        runtime._executors.change_switch_settings = fake_call  # type: ignore[assignment]
+
+        applied: list[bool] = []
+        runtime._apply_options = lambda: applied.append(True)  # type: ignore[assignment]
+
+        runtime.set_scene_brightness_offset(10)
+        entry = hass._config_entry_updates[-1]["entry"]
+        await runtime.async_options_updated(entry)
+        assert not applied
+
+        entry.options = {**entry.options, CONF_SCENES: {"offsets": {"brightness": 0}}}
+        await runtime.async_options_updated(entry)
+        assert applied == [True]
+        await _drain_pending_tasks()
+
+    hass.loop.run_until_complete(scenario())
+
+
+def test_options_reapply_coalesces_boundary_updates(hass: HomeAssistant) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": "living",
+                "al_switch": "switch.living",
+                "lights": ["light.one"],
+                "enabled": True,
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        async def fake_change(entity_id, data: dict) -> dict:
+            return {"status": "ok"}
+
+        runtime._executors.change_switch_settings = fake_change  # type: ignore[assignment]
+        await _drain_pending_tasks()
+
+        passes: list[bool] = []
+
+        async def fake_update() -> None:
+            passes.append(True)
+
+        runtime._update_zone_boundaries = fake_update  # type: ignore[assignment]
+
+        runtime._apply_options()
+        runtime._apply_options()
+        runtime._apply_options()
+        await _drain_pending_tasks()
+        assert passes == [True]
+
+        runtime._apply_options()
+        await _drain_pending_tasks()
+        assert passes == [True, True]
+
+    hass.loop.run_until_complete(scenario())
+
+
+def test_unchanged_tuning_values_do_not_notify_entities(hass: HomeAssistant) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": "living",
+                "al_switch": "switch.living",
+                "lights": ["light.one"],
+                "enabled": True,
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        notified: list[bool] = []
+        runtime.register_entity_callback(lambda: notified.append(True))
+
+        runtime.set_zone_multiplier("living", 1.0)
+        runtime.set_zone_sunrise_offset("living", 0)
+        runtime.set_adjust_brightness_step(runtime.adjust_brightness_step())
+        assert not notified
+
+        runtime.set_zone_multiplier("living", 1.5)
+        assert notified == [True]
+        assert runtime.zone_multiplier("living") == 1.5
+
+    hass.loop.run_until_complete(scenario())
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import asyncio
 
-from custom_components.adaptive_lighting_pro.config_flow import AdaptiveLightingProConfigFlow
+from custom_components.adaptive_lighting_pro.config_flow import (
+    AdaptiveLightingProConfigFlow,
+    AdaptiveLightingProOptionsFlowHandler,
+)
 from custom_components.adaptive_lighting_pro.const import (
     CONF_CONTROLLERS,
     CONF_LUX_SENSOR,
@@ -12,7 +15,7 @@ from custom_components.adaptive_lighting_pro.const import (
     CONF_WEATHER_ENTITY,
     CONF_ZEN32_DEVICE,
 )
-from tests.conftest import HomeAssistant, State
+from tests.conftest import ConfigEntry, HomeAssistant, State
 
 
 def run(coro):
@@ -115,3 +118,11 @@ def test_config_flow_duplicate_zone(hass: HomeAssistant) -> None:
     result = resolve(flow.async_step_user(user_input))
     assert result["type"] == "form"
     assert result["errors"].get("zone_id")
+
+
+def test_options_flow_reuses_schema_for_unchanged_defaults() -> None:
+    entry = ConfigEntry(data={}, options={})
+    first = resolve(AdaptiveLightingProOptionsFlowHandler(entry).async_step_init())
+    second = resolve(AdaptiveLightingProOptionsFlowHandler(entry).async_step_init())
+    assert first["type"] == "form"
+    assert first["schema"] is second["schema"]
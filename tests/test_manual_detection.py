@@ -53,3 +53,21 @@ def test_manual_detection_duration(hass: HomeAssistant) -> None:
 
     duration = hass.loop.run_until_complete(scenario())
     assert duration == 5400
+
+
+def test_enabled_zones_refresh_after_toggle(hass: HomeAssistant) -> None:
+    event_bus = EventBus(hass, debug=False, trace=False)
+    zone_manager = ZoneManager(TimerManager(hass, event_bus, debug=False))
+    zone_manager.load_zones(
+        [
+            {"zone_id": zone_id, "al_switch": f"switch.{zone_id}", "lights": []}
+            for zone_id in ("living", "kitchen")
+        ]
+    )
+    assert zone_manager.enabled_zones() is zone_manager.enabled_zones()
+
+    zone_manager.set_enabled("kitchen", False)
+    assert [zone.zone_id for zone in zone_manager.enabled_zones()] == ["living"]
+
+    zone_manager.apply_overrides({"kitchen": {"enabled": True}})
+    assert len(zone_manager.enabled_zones()) == 2
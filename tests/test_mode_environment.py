@@ -219,3 +219,184 @@ def test_sunset_boost_respects_zone_flags(hass: HomeAssistant) -> None:
                 pytest.fail("Sunset boost should skip zones with sunset disabled")
 
     hass.loop.run_until_complete(scenario())
+
+
+def test_sunset_boost_batches_zones_with_matching_boundaries(hass: HomeAssistant) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": zone_id,
+                "al_switch": f"switch.{zone_id}",
+                "lights": [f"light.{zone_id}"],
+                "enabled": True,
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+            for zone_id in ("living", "kitchen")
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        calls: list[tuple[object, dict]] = []
+
+        async def fake_change(entity_id, data: dict) -> dict:
+            calls.append((entity_id, data))
+            return {"status": "ok"}
+
+        runtime._executors.change_switch_settings = fake_change  # type: ignore[assignment]
+
+        await runtime._handle_environmental_changed(True, sunset_boost_pct=10)
+
+        assert len(calls) == 1
+        entity_ids, data = calls[0]
+        assert sorted(entity_ids) == ["switch.kitchen", "switch.living"]
+        assert data["min_brightness"] == 11
+
+    hass.loop.run_until_complete(scenario())
+
+
+def test_failed_boundary_update_is_retried_next_pass(hass: HomeAssistant) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": "living",
+                "al_switch": "switch.living",
+                "lights": ["light.one"],
+                "enabled": True,
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        responses = [{"status": "error", "error_code": "TimeoutError"}]
+        calls: list[str] = []
+
+        async def fake_change(entity_id, data: dict) -> dict:
+            calls.append(entity_id)
+            return responses.pop(0) if responses else {"status": "ok"}
+
+        runtime._executors.change_switch_settings = fake_change  # type: ignore[assignment]
+
+        await runtime._handle_environmental_changed(True, sunset_boost_pct=10)
+        await runtime._update_zone_boundaries()
+        await runtime._update_zone_boundaries()
+
+        assert calls == ["switch.living", "switch.living"]
+
+    hass.loop.run_until_complete(scenario())
+
+
+def test_sunset_boost_reaches_manual_zone_after_release(hass: HomeAssistant) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": "living",
+                "al_switch": "switch.living",
+                "lights": ["light.one"],
+                "enabled": True,
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        calls: list[str] = []
+
+        async def fake_change(entity_id, data: dict) -> dict:
+            calls.append(entity_id)
+            return {"status": "ok"}
+
+        async def fake_apply(entity_id: str, data: dict) -> dict:
+            return {"status": "ok", "duration_ms": 1}
+
+        runtime._executors.change_switch_settings = fake_change  # type: ignore[assignment]
+        runtime._executors.apply = fake_apply  # type: ignore[assignment]
+
+        runtime._zone_manager.set_manual("living", True, 30)
+        await runtime._handle_environmental_changed(True, sunset_boost_pct=10)
+        assert not calls
+
+        async def fake_manual(entity_id: str, manual: bool) -> dict:
+            return {"status": "ok"}
+
+        runtime._executors.set_manual_control = fake_manual  # type: ignore[assignment]
+
+        await runtime._handle_timer_expired("living")
+        assert calls == ["switch.living"]
+
+        # The sync posted by the expiry must not repeat the boundary pass.
+        passes: list[bool] = []
+        update = runtime._update_zone_boundaries
+
+        async def counting_update() -> None:
+            passes.append(True)
+            await update()
+
+        runtime._update_zone_boundaries = counting_update  # type: ignore[assignment]
+        await asyncio.gather(*(asyncio.all_tasks() - {asyncio.current_task()}))
+        assert not passes
+        assert calls == ["switch.living"]
+
+    hass.loop.run_until_complete(scenario())
+
+
+@pytest.mark.parametrize("release", ["reset_zone", "scene_default"])
+def test_released_zone_gets_current_boundaries_before_sync(
+    hass: HomeAssistant, release: str
+) -> None:
+    async def scenario() -> None:
+        zones = [
+            {
+                "zone_id": "living",
+                "al_switch": "switch.living",
+                "lights": ["light.one"],
+                "enabled": True,
+                "zone_multiplier": 1.0,
+                "sunrise_offset_min": 0,
+                "environmental_boost_enabled": True,
+                "sunset_boost_enabled": True,
+            }
+        ]
+        runtime = await _setup_runtime(hass, zones)
+
+        calls: list[tuple[str, object]] = []
+
+        async def fake_change(entity_id, data: dict) -> dict:
+            calls.append(("change", data["min_brightness"]))
+            return {"status": "ok"}
+
+        async def fake_apply(entity_id: str, data: dict) -> dict:
+            calls.append(("apply", entity_id))
+            return {"status": "ok", "duration_ms": 1}
+
+        async def fake_call(*args) -> dict:
+            return {"status": "ok", "duration_ms": 1}
+
+        runtime._executors.change_switch_settings = fake_change  # type: ignore[assignment]
+        runtime._executors.apply = fake_apply  # type: ignore[assignment]
+        runtime._executors.set_manual_control = fake_call  # type: ignore[assignment]
+        runtime._executors.call_light_service = fake_call  # type: ignore[assignment]
+        await asyncio.gather(*(asyncio.all_tasks() - {asyncio.current_task()}))
+        calls.clear()
+
+        runtime._zone_manager.set_manual("living", True, 30)
+        await runtime._handle_environmental_changed(True, sunset_boost_pct=10)
+        assert not calls
+
+        if release == "reset_zone":
+            await runtime.reset_zone("living")
+        else:
+            await runtime.select_scene("default")
+
+        expected = runtime._zone_baselines["living"].min_brightness + 10
+        assert not runtime.zone_manual_active("living")
+        assert calls[0] == ("change", expected)
+        assert ("apply", "switch.living") in calls[1:]
+
+    hass.loop.run_until_complete(scenario())